@@ -1,10 +1,17 @@
-from .extension.app import KernelStateExtension
+def __getattr__(name):
+    # Import the extension lazily, so that importing a submodule
+    # (e.g. states or types) doesn't pull in all of jupyter_server.
+    if name == "KernelStateExtension":
+        from .extension.app import KernelStateExtension
+        return KernelStateExtension
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _jupyter_server_extension_points():
+    from .extension.app import KernelStateExtension
     return [
         {
-            "module": "nextgen_kernels_api.extension.app", 
+            "module": "nextgen_kernels_api.extension.app",
             "app": KernelStateExtension
         }
     ]
\ No newline at end of file
@@ -1,4 +1,3 @@
-import json
 from tornado import web
 
 from jupyter_server.auth.decorator import authorized
@@ -15,13 +14,16 @@ class KernelStateHandler(ExtensionHandlerMixin, APIHandler):
     @authorized
     def get(self, kernel_id): 
         kernel = self.kernel_manager.get_kernel(kernel_id)
-        state = {
-            "kernel_id": kernel_id,
-            "lifecycle_state": kernel.lifecycle_state,
-            "execution_state": kernel.execution_state
-        }
-        self.write(json.dumps(state))
-        self.finish()
+        # All three values come from constrained alphabets (the kernel ID
+        # regex and the validated state literals), so none of them need
+        # JSON escaping and the body can be assembled directly.
+        body = (
+            b'{"kernel_id":"' + kernel_id.encode()
+            + b'","lifecycle_state":"' + kernel.lifecycle_state.encode()
+            + b'","execution_state":"' + kernel.execution_state.encode()
+            + b'"}'
+        )
+        self.finish(body)
         
         
 handlers = [
@@ -1,28 +1,41 @@
 import asyncio
 import typing as t
 from traitlets import Set
+from traitlets import Dict
 from traitlets import Instance
 from traitlets import Any
 from traitlets import HasTraits
+from traitlets import default
 from .utils import LRUCache
 from jupyter_client.asynchronous.client import AsyncKernelClient
 
 import anyio
 
 
+# The channels that are polled for messages coming from the kernel.
+_LISTEN_CHANNELS = ("shell", "control", "stdin", "iopub")
+
+
 class KernelListenerMixin(HasTraits): 
     """"""
     _client: t.Optional[AsyncKernelClient] = Instance(AsyncKernelClient, allow_none=True)
+
+    # The client's channels, looked up once when connecting
+    # rather than on every message.
+    _channels_by_name = Dict()
     
     # Having this message cache is not ideal. 
     # Unfortunately, we don't include the parent channel
     # in the messages that generate IOPub status messages, thus,
     # we can't differential between the control channel vs.
-    # shell channel status. This message cache gives us 
-    # the ability to map status message back to their source.
-    message_source_cache = Instance(
-        default_value=LRUCache(maxsize=1000), klass=LRUCache
-    )
+    # shell channel status. Only shell requests affect the
+    # execution state, so we keep a bounded set (the cache's
+    # values are unused) of the msg_ids sent on the shell channel.
+    _shell_msg_ids = Instance(klass=LRUCache)
+
+    @default("_shell_msg_ids")
+    def _default_shell_msg_ids(self):
+        return LRUCache(maxsize=1000)
 
     # A set of callables that are called when a
     # ZMQ message comes back from the kernel.
@@ -39,9 +52,11 @@ class KernelListenerMixin(HasTraits):
         # Wrap a taskgroup so that it can be backgrounded.
         async def _listening():
             async with anyio.create_task_group() as tg:
-                for channel_name in ["shell", "control", "stdin", "iopub"]:
+                for channel_name in _LISTEN_CHANNELS:
                     tg.start_soon(
-                        self._listen_for_messages, channel_name
+                        self._listen_for_messages,
+                        self._channels_by_name[channel_name],
+                        channel_name
                     )
     
         # Background this task.
@@ -68,13 +83,11 @@ class KernelListenerMixin(HasTraits):
 
     def send_message(self, channel_name, msg):
         """Use the given session to send the message."""
-        # Cache the message ID and its socket name so that
-        # any response message can be mapped back to the
-        # source channel.
-        msg_id = msg["header"]["msg_id"]
-        self.message_source_cache[msg_id] = channel_name
-        channel = getattr(self._client, f"{channel_name}_channel")
-        channel.send(msg)
+        # Remember shell message IDs so that any status
+        # message can be mapped back to its source channel.
+        if channel_name == "shell":
+            self._shell_msg_ids[msg["header"]["msg_id"]] = None
+        self._channels_by_name[channel_name].send(msg)
         
     async def recv_message(self, channel_name, raw_msg):
         """This is the main method that consumes every
@@ -84,22 +97,17 @@ class KernelListenerMixin(HasTraits):
         when appropriate. Then, it routes the message
         to all listeners.
         """
-        # Broadcast messages
-        async with anyio.create_task_group() as tg:
-            # Broadcast the message to all listeners.
-            for listener in self._listeners:
-
-                async def _wrap_listener(listener, channel_name, raw_msg): 
-                    """
-                    Wrap the listener to ensure its async and 
-                    logs (instead of raises) exceptions.
-                    """
-                    try:
-                        listener(channel_name, raw_msg)
-                    except Exception as err:
-                        self.log.error(err)
-                
-                tg.start_soon(_wrap_listener, listener, channel_name, raw_msg)
+        # Broadcast the message to all listeners. Listeners are
+        # synchronous, so call them directly rather than spawning a
+        # task per listener. Iterate over a snapshot in case a
+        # listener adds or removes listeners.
+        for listener in tuple(self._listeners):
+            try:
+                listener(channel_name, raw_msg)
+            except Exception as err:
+                # Log (instead of raise) exceptions so one failing
+                # listener doesn't block the rest.
+                self.log.error(err)
 
     def add_listener(self, callback: t.Callable[[dict], None]):
         """Add a listener to the ZMQ Interface.
@@ -117,13 +125,10 @@ class KernelListenerMixin(HasTraits):
         """
         self._listeners.discard(callback)
 
-    async def _listen_for_messages(self, channel_name):
+    async def _listen_for_messages(self, channel, channel_name):
         """The basic polling loop for listened to kernel messages
         on a ZMQ socket.
         """
-        # Wire up the ZMQ sockets
-        # Setup up ZMQSocket broadcasting.
-        channel = getattr(self._client, f"{channel_name}_channel")
         while True:
             # Wait for a message
             await channel.socket.poll(timeout=float("inf"))
@@ -138,32 +143,41 @@ class KernelListenerMixin(HasTraits):
         # Only continue if we're on the IOPub where the status is published.
         if channel_name != "iopub":
             return
-        # Deserialize the message
+        # Split off the identities; the remaining frames are
+        # [signature, header, parent_header, metadata, content, ...]
         _, smsg = self.session.feed_identities(raw_msg)
-        # Only deserialize the headers to determine is this is a status message
-        deserialized_msg = self.session.deserialize(smsg, content=False)
-        if deserialized_msg["msg_type"] == "status":
-            content = self.session.unpack(deserialized_msg["content"])
+        if self._verify_hmac_enabled:
+            # Check the signature before trusting anything in the message.
+            deserialized_msg = self.session.deserialize(smsg, content=False)
+            msg_type = deserialized_msg["msg_type"]
+            parent_header = deserialized_msg["parent_header"]
+        else:
+            # Only unpack the header to determine if this is a status message.
+            msg_type = self.session.unpack(smsg[1])["msg_type"]
+            parent_header = None
+        if msg_type == "status":
+            content = self.session.unpack(smsg[4])
             status = content["execution_state"]
             if status == "starting":
                 # Don't broadcast, since this message is already going out.
                 self.set_state("starting", status, broadcast=False)
             else:
-                parent = deserialized_msg.get("parent_header", {})
-                msg_id = parent.get("msg_id", "")
-                parent_channel = self.message_source_cache.get(msg_id, None)
-                if parent_channel and parent_channel == "shell":
+                if parent_header is None:
+                    parent_header = self.session.unpack(smsg[2])
+                if parent_header.get("msg_id") in self._shell_msg_ids:
                     # Don't broadcast, since this message is already going out.
                     self.set_state("connected", status, broadcast=False)
 
     def broadcast_state(self):
         """Broadcast state to all listeners"""
+        if not self._listeners:
+            return
+        # Manufacture a single message; listeners only read it.
+        msg = self.session.msg("status", {"execution_state": self.execution_state})
+        raw_msg = self.session.serialize(msg)
         # Emit this state to all listeners
         for listener in self._listeners:
-            # Manufacture a message
-            msg = self.session.msg("status", {"execution_state": self.execution_state})
-            raw_msg = self.session.serialize(msg)
-            listener("iopub", raw_msg)    
+            listener("iopub", raw_msg)
 
     async def connect(self):
         """Open a single client interface to the kernel.
@@ -178,6 +192,10 @@ class KernelListenerMixin(HasTraits):
         self.set_state("connecting", "busy")
         # Use the new API for getting a client.
         self._client = self.client()
+        self._channels_by_name = {
+            name: getattr(self._client, f"{name}_channel")
+            for name in _LISTEN_CHANNELS
+        }
         # Track execution state by watching all messages that come through
         # the kernel client.
         self.add_listener(self.execution_state_listener)
@@ -186,17 +204,18 @@ class KernelListenerMixin(HasTraits):
         # The Heartbeat channel is paused by default; unpause it here
         self._client.hb_channel.unpause()
         # Wait for a living heartbeat.
-        attempt = 0
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.time_to_connect
         while not self._client.hb_channel.is_alive():
-            attempt += 1
-            if attempt > self.time_to_connect:
+            if loop.time() > deadline:
                 # Set the state to unknown.
                 self.set_state("unknown", "unknown")
                 raise Exception("The kernel took too long to connect to the ZMQ sockets.")
-            # Wait a second until the next time we try again.
-            await asyncio.sleep(1)
+            # Check often so a ready kernel isn't kept waiting a full second.
+            await asyncio.sleep(0.1)
         self.set_state("connected")
         
     async def disconnect(self):
         await self.stop_listening()
-        self._client.stop_channels()
\ No newline at end of file
+        self._client.stop_channels()
+        self._channels_by_name = {}
\ No newline at end of file
@@ -2,15 +2,18 @@ import typing
 import asyncio
 from traitlets import default
 from traitlets import Instance
+from traitlets import Bool
 from traitlets import Int
 from traitlets import Type
 from traitlets import Unicode
 from traitlets import validate
+from traitlets import observe
 from traitlets import TraitError
 from traitlets import DottedObjectName
 from traitlets.utils.importstring import import_item
 
 from jupyter_client.asynchronous.client import AsyncKernelClient
+from jupyter_client.localinterfaces import localhost
 from jupyter_client.manager import AsyncKernelManager
 
 from . import types
@@ -25,12 +28,38 @@ class NextGenKernelManager(KernelListenerMixin, AsyncKernelManager):
         default_value=10,
         help="The timeout for connecting to a kernel."
     ).tag(config=True)
+
+    verify_hmac = Bool(
+        None,
+        allow_none=True,
+        help=(
+            "Verify the HMAC signature of messages coming from the kernel, "
+            "both when tracking kernel state and when forwarding messages to "
+            "websockets. If unset, messages are only verified when the kernel "
+            "isn't using the ipc transport or a loopback address."
+        )
+    ).tag(config=True)
+
+    # Whether messages from the kernel are actually verified, resolved
+    # from `verify_hmac`, `transport`, and `ip`. It's stored (and kept
+    # up to date below) so that the per-message path only reads it.
+    _verify_hmac_enabled = Bool()
+
+    @default("_verify_hmac_enabled")
+    def _default_verify_hmac_enabled(self):
+        if self.verify_hmac is not None:
+            return self.verify_hmac
+        return not (self.transport == "ipc" or self.ip.startswith("127.") or self.ip == localhost())
+
+    @observe("verify_hmac", "transport", "ip")
+    def _update_verify_hmac_enabled(self, change):
+        self._verify_hmac_enabled = self._default_verify_hmac_enabled()
     
     _execution_state: types.EXECUTION_STATES = Unicode()
     
     @validate("_execution_state")
     def _validate_execution_state(self, proposal: dict):
-        if not proposal["value"] in states.EXECUTION_STATES:
+        if proposal["value"] not in states.EXECUTION_STATES_SET:
             raise TraitError(f"execution_state must be one of {states.EXECUTION_STATES}")
         return proposal["value"]
     
@@ -46,7 +75,7 @@ class NextGenKernelManager(KernelListenerMixin, AsyncKernelManager):
     
     @validate("_lifecycle_state")
     def _validate_lifecycle_state(self, proposal: dict):
-        if not proposal["value"] in states.LIFECYCLE_STATES:
+        if proposal["value"] not in states.LIFECYCLE_STATES_SET:
             raise TraitError(f"lifecycle_state must be one of {states.LIFECYCLE_STATES}")
         return proposal["value"]
 
@@ -60,12 +89,16 @@ class NextGenKernelManager(KernelListenerMixin, AsyncKernelManager):
         execution_state: typing.Optional[types.EXECUTION_STATES] = None,
         broadcast=True
     ):
-        if lifecycle_state:
+        changed = False
+        if lifecycle_state and lifecycle_state != self._lifecycle_state:
             self._lifecycle_state = lifecycle_state
-        if execution_state:
+            changed = True
+        if execution_state and execution_state != self._execution_state:
             self._execution_state = execution_state
-            
-        if broadcast:
+            changed = True
+
+        # Skip the broadcast if nothing actually changed.
+        if changed and broadcast:
             # Broadcast this state change to all listeners
             self.broadcast_state()
 
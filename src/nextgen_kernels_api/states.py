@@ -3,4 +3,6 @@ from . import types
 
 EXECUTION_STATES: typing.Tuple[types.EXECUTION_STATES] = typing.get_args(types.EXECUTION_STATES)
 LIFECYCLE_STATES: typing.Tuple[types.LIFECYCLE_STATES] = typing.get_args(types.LIFECYCLE_STATES)
+EXECUTION_STATES_SET: typing.FrozenSet[types.EXECUTION_STATES] = frozenset(EXECUTION_STATES)
+LIFECYCLE_STATES_SET: typing.FrozenSet[types.LIFECYCLE_STATES] = frozenset(LIFECYCLE_STATES)
 LIFECYCLE_DEAD_STATES = ["dead", "disconnected", "terminated"]
\ No newline at end of file
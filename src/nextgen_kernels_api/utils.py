@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from itertools import islice
 
 
 class LRUCache(OrderedDict):
@@ -15,6 +16,11 @@ class LRUCache(OrderedDict):
 
     def __setitem__(self, key, value):
         super().__setitem__(key, value)
+        self.move_to_end(key)
         if len(self) > self.maxsize:
-            oldest = next(iter(self))
-            del self[oldest]
\ No newline at end of file
+            self.popitem(last=False)
+
+    def __repr__(self):
+        # The cache can hold many entries; only show the most recent keys.
+        recent = list(islice(reversed(self), 10))
+        return f"{type(self).__name__}(maxsize={self.maxsize}, size={len(self)}, recent={recent!r})"
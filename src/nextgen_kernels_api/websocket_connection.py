@@ -30,27 +30,52 @@ class NextGenKernelWebsocketConnection(BaseKernelWebsocketConnection):
     # new (problematic) subprotocol.
     kernel_ws_protocol = ""
 
-    _session: Session = Instance(Session, allow_none=True)
+    session: Session = Instance(Session)
 
-    @property
-    def session(self) -> Session:
-        # Ensure the key is always correct.
-        if not self._session:
-            self._session = self.kernel_manager.session.clone()
-        self._session.key = self.kernel_manager.session.key
-        return self._session
+    @default("session")
+    def _default_session(self):
+        return self.kernel_manager.session.clone()
+
+    def refresh_session_key(self):
+        """Sync the session's key and auth with the kernel manager's session.
+
+        The session is cloned once (by its default) and updated in place
+        here, so anything set on it, like the client's session ID, is kept.
+        This is called when connecting, and again whenever the kernel
+        manager's session key or HMAC verification policy changes.
+        """
+        km = self.kernel_manager
+        self.session.key = km.session.key
+        # Skip the signature check when deserializing messages from
+        # a loopback kernel; it costs a SHA-256 per message. Sharing
+        # the HMAC object is safe since `Session.sign` copies it.
+        self.session.auth = km.session.auth if km._verify_hmac_enabled else None
 
     async def connect(self):
         """A synchronous method for connecting to the kernel via a kernel session.
         This connection might take a few minutes, so we turn this into an
         asyncio task happening in parallel.
         """
+        self.refresh_session_key()
+        # Keep the session in sync if the key or the HMAC
+        # verification policy change after connecting.
+        self.kernel_manager.session.observe(self._on_session_change, "key")
+        self.kernel_manager.observe(self._on_session_change, "_verify_hmac_enabled")
         self.kernel_manager.add_listener(self.handle_outgoing_message)
         self.kernel_manager.broadcast_state()
         self.log.info("Kernel websocket is now listening to kernel.")
 
     def disconnect(self):
         self.kernel_manager.remove_listener(self.handle_outgoing_message)
+        try:
+            self.kernel_manager.session.unobserve(self._on_session_change, "key")
+            self.kernel_manager.unobserve(self._on_session_change, "_verify_hmac_enabled")
+        except ValueError:
+            # We were never connected (or already disconnected).
+            pass
+
+    def _on_session_change(self, change):
+        self.refresh_session_key()
 
     def handle_incoming_message(self, ws_message):
         """Handle the incoming WS message"""
@@ -0,0 +1,54 @@
+import pytest
+from jupyter_client.localinterfaces import localhost
+from jupyter_client.session import Session
+
+from nextgen_kernels_api.kernel_manager import NextGenKernelManager
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"transport": "ipc"}, False),
+        ({"ip": "127.0.0.1"}, False),
+        ({"ip": localhost()}, False),
+        ({"ip": "192.168.1.10"}, True),
+        ({"ip": "0.0.0.0"}, True),
+        ({"ip": ""}, True),
+        ({"ip": "127.0.0.1", "verify_hmac": True}, True),
+        ({"ip": "192.168.1.10", "verify_hmac": False}, False),
+    ],
+)
+def test_verify_hmac_policy(kwargs, expected):
+    km = NextGenKernelManager(**kwargs)
+    assert km._verify_hmac_enabled is expected
+
+
+def test_verify_hmac_policy_follows_ip():
+    km = NextGenKernelManager(ip="127.0.0.1")
+    assert km._verify_hmac_enabled is False
+    km.ip = "192.168.1.10"
+    assert km._verify_hmac_enabled is True
+
+
+def _status_message(km, session):
+    """Build a raw `busy` status message, signed by `session`, whose
+    parent was sent on the shell channel.
+    """
+    parent = km.session.msg("execute_request", {})
+    km._shell_msg_ids[parent["header"]["msg_id"]] = None
+    msg = session.msg("status", {"execution_state": "busy"}, parent=parent)
+    return session.serialize(msg)
+
+
+def test_execution_state_listener_verified_message():
+    km = NextGenKernelManager(verify_hmac=True)
+    km.execution_state_listener("iopub", _status_message(km, km.session))
+    assert km.execution_state == "busy"
+
+
+def test_execution_state_listener_rejects_bad_signature():
+    km = NextGenKernelManager(verify_hmac=True)
+    forger = Session(key=b"not-the-kernel-key")
+    with pytest.raises(ValueError, match="Invalid Signature"):
+        km.execution_state_listener("iopub", _status_message(km, forger))
+    assert km.execution_state != "busy"